@@ -2,9 +2,9 @@
 """Calcurse-style Canvas Calendar Package."""
 
 from .main_app import CalcurseCanvasApp
-from .config import Config
+from .config import Config, Settings
 from .models import Assignment, AssignmentCollection
 from .canvas_api import CanvasAPIClient
 
 __version__ = "1.0.0"
-__all__ = ["CalcurseCanvasApp", "Config", "Assignment", "AssignmentCollection", "CanvasAPIClient"]
\ No newline at end of file
+__all__ = ["CalcurseCanvasApp", "Config", "Settings", "Assignment", "AssignmentCollection", "CanvasAPIClient"]
\ No newline at end of file
@@ -1,33 +1,80 @@
 """Canvas API integration module."""
 
 from canvasapi import Canvas
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 import logging
+import time
 
-from .config import Config
+from .config import Config, Settings
 from .models import Assignment, AssignmentCollection
+from .replay import install_transport
 
 logger = logging.getLogger(__name__)
 
 class CanvasAPIClient:
     """Client for interacting with Canvas API."""
-    
+
     def __init__(self, config: Config):
         self.config = config
-        self.canvas = Canvas(base_url=config.api_url, access_token=config.api_key)
-    
-    def load_assignments(self) -> AssignmentCollection:
-        """Load assignments from Canvas API."""
+        self._settings: Optional[Settings] = None
+        self._cache: Optional[AssignmentCollection] = None
+        self._cache_time = 0.0
+        self._apply_settings(config.settings)
+
+    def _apply_settings(self, settings: Settings):
+        """Switch to a new settings snapshot, reconnecting and dropping the cache if needed."""
+        previous = self._settings
+        self._settings = settings
+
+        if previous is None or self._connection_settings(previous) != self._connection_settings(settings):
+            self.canvas = Canvas(base_url=settings.api_url, access_token=settings.api_key)
+            install_transport(self.canvas, settings)
+
+        if previous is not None and self._fetch_settings(previous) != self._fetch_settings(settings):
+            self._cache = None
+
+    @staticmethod
+    def _connection_settings(settings: Settings) -> tuple:
+        """Return the settings that require a new Canvas connection when changed."""
+        return (settings.api_url, settings.api_key, settings.transport, settings.cassette_dir,
+                settings.replay_latency, settings.replay_jitter, settings.replay_failure_rate,
+                settings.replay_failure_status, settings.replay_seed)
+
+    @classmethod
+    def _fetch_settings(cls, settings: Settings) -> tuple:
+        """Return the settings that change the fetched assignments when changed."""
+        return cls._connection_settings(settings) + (
+            settings.course_list, settings.timezone, settings.page_size)
+
+    def load_assignments(self, force: bool = False) -> AssignmentCollection:
+        """Load assignments from Canvas API.
+
+        Results are cached for ``cache_ttl`` seconds unless ``force`` is set.
+        """
+        if self.config.settings is not self._settings:
+            self._apply_settings(self.config.settings)
+        settings = self._settings
+
+        if (not force and self._cache is not None
+                and time.monotonic() - self._cache_time < settings.cache_ttl):
+            return self._cache
+
         collection = AssignmentCollection()
-        
+        complete = True
+
         try:
-            for course_id in self.config.course_list:
-                if not course_id.strip():  # Skip empty course IDs
-                    continue
-                    
-                self._load_course_assignments(course_id.strip(), collection)
-                
+            with ThreadPoolExecutor(max_workers=settings.concurrency) as executor:
+                results = executor.map(
+                    lambda course_id: self._load_course_assignments(course_id, settings),
+                    settings.course_list
+                )
+                for assignments, course_complete in results:
+                    complete = complete and course_complete
+                    for assignment in assignments:
+                        collection.add_assignment(assignment)
+
         except Exception as e:
             logger.error(f"Error loading assignments: {str(e)}")
             # Add error assignment for debugging
@@ -39,20 +86,38 @@ class CanvasAPIClient:
                 url=None
             )
             collection.add_assignment(error_assignment)
-        
+            return collection
+
+        # Don't serve a partial load from the cache for the next cache_ttl seconds
+        if not complete:
+            return collection
+
+        self._cache = collection
+        self._cache_time = time.monotonic()
         return collection
-    
-    def _load_course_assignments(self, course_id: str, collection: AssignmentCollection):
-        """Load assignments for a specific course."""
+
+    def _load_course_assignments(self, course_id: str,
+                                 settings: Settings) -> Tuple[List[Assignment], bool]:
+        """Load assignments for a specific course.
+
+        Returns the assignments loaded and whether the course loaded without errors.
+        """
+        course_assignments = []
+
         try:
             curr_course = self.canvas.get_course(course_id)
             assignments = curr_course.get_assignments()
-            
+            # canvasapi always adds its own per_page=100 to the first request, and
+            # a second per_page kwarg is sent as a duplicate that Canvas ignores.
+            # _first_params is private; verified against canvasapi 3.6.0 (see README)
+            assignments._first_params["per_page"] = settings.page_size
+
             for assignment in assignments:
                 if assignment.due_at:
                     # Parse due date
                     due_date = datetime.fromisoformat(assignment.due_at.replace('Z', '+00:00'))
-                    
+                    due_date = settings.localize(due_date)
+
                     canvas_assignment = Assignment(
                         name=assignment.name,
                         course=curr_course.name,
@@ -60,8 +125,11 @@ class CanvasAPIClient:
                         due_time=due_date.strftime('%H:%M'),
                         url=getattr(assignment, 'html_url', None)
                     )
-                    
-                    collection.add_assignment(canvas_assignment)
-                    
+
+                    course_assignments.append(canvas_assignment)
+
         except Exception as e:
-            logger.error(f"Error loading assignments for course {course_id}: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error loading assignments for course {course_id}: {str(e)}")
+            return course_assignments, False
+
+        return course_assignments, True
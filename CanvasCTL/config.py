@@ -1,32 +1,232 @@
 """Configuration management for Canvas Calendar application."""
 
 import os
+import logging
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from dotenv import load_dotenv
-from typing import List
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_FILE = "canvasctl.toml"
+
+# Environment variables that override settings from the TOML file
+ENV_OVERRIDES = {
+    "api_url": "API_URL",
+    "api_key": "API_KEY",
+    "course_list": "COURSE_LIST",
+    "concurrency": "CANVASCTL_CONCURRENCY",
+    "cache_ttl": "CANVASCTL_CACHE_TTL",
+    "timezone": "CANVASCTL_TIMEZONE",
+    "page_size": "CANVASCTL_PAGE_SIZE",
+    "refresh_interval": "CANVASCTL_REFRESH_INTERVAL",
+    "transport": "CANVASCTL_TRANSPORT",
+    "cassette_dir": "CANVASCTL_CASSETTE_DIR",
+    "replay_latency": "CANVASCTL_REPLAY_LATENCY",
+    "replay_jitter": "CANVASCTL_REPLAY_JITTER",
+    "replay_failure_rate": "CANVASCTL_REPLAY_FAILURE_RATE",
+    "replay_failure_status": "CANVASCTL_REPLAY_FAILURE_STATUS",
+    "replay_seed": "CANVASCTL_REPLAY_SEED",
+}
+
+TRANSPORTS = ("live", "record", "replay")
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of parsed and validated application settings."""
+    api_url: str
+    api_key: str
+    course_list: Tuple[str, ...]
+    concurrency: int = 4
+    cache_ttl: float = 300.0
+    timezone: str = ""
+    page_size: int = 100
+    refresh_interval: float = 0.0
+    transport: str = "live"
+    cassette_dir: str = "cassettes"
+    replay_latency: float = 0.0
+    replay_jitter: float = 0.0
+    replay_failure_rate: float = 0.0
+    replay_failure_status: int = 0
+    replay_seed: int = 0
+
+    @property
+    def tz(self) -> Optional[tzinfo]:
+        """Return the fixed zone due dates are converted to, or None for Canvas' UTC or "local"."""
+        if self.timezone.lower() in ("", "local"):
+            return None
+        if self.timezone.upper() == "UTC":
+            return timezone.utc
+        return ZoneInfo(self.timezone)
+
+    def localize(self, due_date: datetime) -> datetime:
+        """Convert an aware Canvas due date to the configured timezone."""
+        if self.timezone.lower() == "local":
+            # No argument, so the system's DST rules for that date apply
+            return due_date.astimezone()
+        tz = self.tz
+        return due_date.astimezone(tz) if tz is not None else due_date
+
+def _parse_course_list(value: Any) -> Tuple[str, ...]:
+    """Normalise a comma separated string or list of course IDs."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(str(course_id).strip() for course_id in value if str(course_id).strip())
+
+def _coerce(name: str, value: Any) -> Any:
+    """Convert a raw TOML/env value to the type expected by ``Settings``."""
+    try:
+        if name == "course_list":
+            return _parse_course_list(value)
+        if name in ("concurrency", "page_size", "replay_failure_status", "replay_seed"):
+            # Reject TOML booleans and floats like 2.7 rather than truncating them
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError(value)
+            return int(value)
+        if name in ("cache_ttl", "refresh_interval", "replay_latency", "replay_jitter",
+                    "replay_failure_rate"):
+            if isinstance(value, bool):
+                raise ValueError(value)
+            return float(value)
+        # Don't stringify TOML arrays, tables or numbers into nonsense values
+        if not isinstance(value, str):
+            raise ValueError(value)
+        return value.strip()
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid value for setting '{name}': {value!r}")
+
+def _read_config_file(path: Optional[str]) -> Dict[str, Any]:
+    """Read settings from a TOML file, returning an empty dict if it does not exist."""
+    if not path or not os.path.isfile(path):
+        return {}
+
+    with open(path, "rb") as f:
+        try:
+            data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid config file {path}: {str(e)}")
+
+    # Allow settings either at top level or under a [canvasctl] table
+    data = data.get("canvasctl", data)
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid config file {path}: [canvasctl] must be a table")
+    known = {field.name for field in fields(Settings)}
+    unknown = set(data) - known
+    if unknown:
+        raise ValueError(f"Unknown settings in {path}: {', '.join(sorted(unknown))}")
+    return data
+
+def _validate(settings: Settings) -> Settings:
+    """Validate a settings object, raising ValueError on the first problem."""
+    # Replayed responses are scrubbed, so no real API key is needed offline
+    required = ("api_url", "course_list") if settings.transport == "replay" else ("api_url", "api_key", "course_list")
+    missing = [name for name in required if not getattr(settings, name)]
+    if missing:
+        missing_vars = [f"{name} ({ENV_OVERRIDES[name]})" for name in missing]
+        raise ValueError(f"Missing required settings: {', '.join(missing_vars)}")
+
+    if settings.concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if settings.page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if settings.cache_ttl < 0:
+        raise ValueError("cache_ttl must not be negative")
+    if settings.refresh_interval < 0:
+        raise ValueError("refresh_interval must not be negative")
+    if settings.transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of: {', '.join(TRANSPORTS)}")
+    if settings.replay_latency < 0 or settings.replay_jitter < 0:
+        raise ValueError("replay_latency and replay_jitter must not be negative")
+    if not 0 <= settings.replay_failure_rate <= 1:
+        raise ValueError("replay_failure_rate must be between 0 and 1")
+    if settings.replay_failure_status and not 400 <= settings.replay_failure_status <= 599:
+        raise ValueError("replay_failure_status must be 0 or an HTTP error status (400-599)")
+
+    try:
+        settings.tz
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        raise ValueError(f"Unknown timezone: {settings.timezone}")
+
+    return settings
+
+def load_settings(path: Optional[str] = None) -> Settings:
+    """Build settings from defaults, the TOML file at ``path`` and environment overrides."""
+    raw = _read_config_file(path)
+
+    for name, env_var in ENV_OVERRIDES.items():
+        value = os.getenv(env_var)
+        if value:
+            raw[name] = value
+
+    values = {name: _coerce(name, value) for name, value in raw.items()}
+    values.setdefault("api_url", "")
+    values.setdefault("api_key", "")
+    values.setdefault("course_list", ())
+    return _validate(Settings(**values))
 
 class Config:
-    """Configuration class for Canvas API and application settings."""
-    
-    def __init__(self):
+    """Configuration class for Canvas API and application settings.
+
+    Settings are parsed once into an immutable ``Settings`` object. Call
+    ``reload_if_changed`` to pick up edits to the config file at runtime.
+    """
+
+    def __init__(self, path: Optional[str] = None):
         load_dotenv()
-        self._validate_env_vars()
-    
+        self.path = path or os.getenv("CANVASCTL_CONFIG", DEFAULT_CONFIG_FILE)
+        self._mtime = self._file_mtime()
+        self._settings = load_settings(self.path)
+
+    @property
+    def settings(self) -> Settings:
+        return self._settings
+
     @property
     def api_url(self) -> str:
-        return os.getenv("API_URL")
-    
+        return self._settings.api_url
+
     @property
     def api_key(self) -> str:
-        return os.getenv("API_KEY")
-    
+        return self._settings.api_key
+
     @property
-    def course_list(self) -> List[str]:
-        return os.getenv("COURSE_LIST", "").split(",")
-    
-    def _validate_env_vars(self):
-        """Validate that required environment variables are set."""
-        required_vars = ["API_URL", "API_KEY", "COURSE_LIST"]
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
-        
-        if missing_vars:
-            raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
\ No newline at end of file
+    def course_list(self) -> Tuple[str, ...]:
+        return self._settings.course_list
+
+    def _file_mtime(self) -> Optional[float]:
+        """Return the config file's modification time, or None if it is missing."""
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        """Reload settings if the config file changed. Returns True if settings changed.
+
+        Invalid edits are logged and the previous settings are kept.
+        """
+        mtime = self._file_mtime()
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        try:
+            settings = load_settings(self.path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring invalid config file {self.path}: {str(e)}")
+            return False
+
+        if settings == self._settings:
+            return False
+
+        logger.info(f"Reloaded configuration from {self.path}")
+        self._settings = settings
+        return True
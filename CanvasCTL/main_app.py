@@ -4,6 +4,7 @@
 import urwid
 from datetime import date
 import logging
+import time
 
 from .config import Config
 from .canvas_api import CanvasAPIClient
@@ -15,6 +16,9 @@ from .keyboard_handler import KeyboardHandler
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds between checks for config file changes and scheduled refreshes
+TICK_INTERVAL = 2
+
 class CalcurseCanvasApp:
     """Main application class for the calcurse-style Canvas Calendar."""
     
@@ -22,6 +26,7 @@ class CalcurseCanvasApp:
         self.config = Config()
         self.api_client = CanvasAPIClient(self.config)
         self.assignments = self.api_client.load_assignments()
+        self._last_refresh = time.monotonic()
         
         # Create UI components
         self.calendar_widget = CalendarWidget(self.assignments, self.day_selected)
@@ -118,10 +123,11 @@ class CalcurseCanvasApp:
         calendar_box = main_columns.contents[0][0]
         calendar_box.contents[0] = (self.calendar_header, ('pack', None))
     
-    def refresh_assignments(self):
+    def refresh_assignments(self, force: bool = True):
         """Refresh assignments from Canvas API."""
         logger.info("Refreshing assignments from Canvas...")
-        self.assignments = self.api_client.load_assignments()
+        self.assignments = self.api_client.load_assignments(force=force)
+        self._last_refresh = time.monotonic()
         self.calendar_widget.assignments = self.assignments
         self.appointment_widget.assignments = self.assignments
         self.calendar_widget.update()
@@ -130,6 +136,17 @@ class CalcurseCanvasApp:
         if self.appointment_widget.current_date:
             self.appointment_widget.update_for_date(self.appointment_widget.current_date)
     
+    def on_tick(self, loop, user_data=None):
+        """Hot-reload the config file and run scheduled refreshes."""
+        if self.config.reload_if_changed():
+            self.refresh_assignments(force=False)
+        else:
+            interval = self.config.settings.refresh_interval
+            if interval and time.monotonic() - self._last_refresh >= interval:
+                self.refresh_assignments()
+        
+        loop.set_alarm_in(TICK_INTERVAL, self.on_tick)
+    
     def run(self):
         """Run the main application loop."""
         # Create main loop
@@ -149,6 +166,9 @@ class CalcurseCanvasApp:
         # Set the input handler - back to simple unhandled_input
         loop.unhandled_input = self.keyboard_handler.handle_input
         
+        # Watch for config changes and scheduled refreshes
+        loop.set_alarm_in(TICK_INTERVAL, self.on_tick)
+        
         try:
             logger.info("Starting calcurse-style Canvas Calendar application...")
             loop.run()
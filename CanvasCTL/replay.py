@@ -0,0 +1,179 @@
+"""Record/replay transport for running the Canvas client offline."""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .config import Settings
+
+logger = logging.getLogger(__name__)
+
+# URL-safe so scrubbed pagination links still parse
+SCRUBBED = "SCRUBBED"
+
+# Response headers that are not stored, either sensitive or no longer accurate
+# once the body has been decoded
+DROPPED_HEADERS = {"set-cookie", "content-encoding", "content-length", "transfer-encoding"}
+
+_TOKEN_PARAM = re.compile(r"(access_token=)[^&>\s\"]*")
+
+class ReplayMissError(requests.exceptions.RequestException):
+    """Raised when a replayed request has no matching recording."""
+
+def _scrub(text: str, secret: str) -> str:
+    """Remove access tokens from a URL, header value or response body."""
+    text = _TOKEN_PARAM.sub(rf"\g<1>{SCRUBBED}", text)
+    if secret:
+        text = text.replace(secret, SCRUBBED)
+    return text
+
+def request_key(request: requests.PreparedRequest) -> str:
+    """Return a stable identifier for a request, independent of query order and tokens."""
+    parts = urlsplit(request.url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k != "access_token")
+    url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha1(body).hexdigest()[:8] if body else ""
+    return f"{request.method} {url} {digest}".rstrip()
+
+def _cassette_path(cassette_dir: str, key: str) -> str:
+    """Return the file a request with ``key`` is recorded to."""
+    method = key.split(" ", 1)[0].lower()
+    return os.path.join(cassette_dir, f"{method}_{hashlib.sha1(key.encode()).hexdigest()[:16]}.json")
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that performs real requests and saves scrubbed responses."""
+
+    def __init__(self, cassette_dir: str, secret: str = ""):
+        super().__init__()
+        self.cassette_dir = cassette_dir
+        self.secret = secret
+        os.makedirs(cassette_dir, exist_ok=True)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        key = request_key(request)
+
+        record = {
+            "key": key,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {name: _scrub(value, self.secret)
+                        for name, value in response.headers.items()
+                        if name.lower() not in DROPPED_HEADERS},
+            "body": _scrub(response.text, self.secret),
+        }
+
+        with open(_cassette_path(self.cassette_dir, key), "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+
+        return response
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that serves recorded responses with simulated latency and failures.
+
+    Injected failures raise a connection error, or return ``failure_status``
+    (e.g. 429 or 503) if it is set. Latency and failures are derived from ``seed``, the request and how many
+    times it has been made, so runs are reproducible regardless of thread
+    scheduling.
+    """
+
+    def __init__(self, cassette_dir: str, latency: float = 0.0, jitter: float = 0.0,
+                 failure_rate: float = 0.0, failure_status: int = 0, seed: int = 0):
+        super().__init__()
+        self.cassette_dir = cassette_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.seed = seed
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        key = request_key(request)
+
+        with self._lock:
+            attempt = self._calls[key]
+            self._calls[key] += 1
+        rng = random.Random(f"{self.seed}:{key}:{attempt}")
+
+        time.sleep(self.latency + rng.uniform(0, self.jitter))
+
+        if rng.random() < self.failure_rate:
+            if not self.failure_status:
+                raise requests.exceptions.ConnectionError(f"Injected failure for {key}", request=request)
+            record = {
+                "status": self.failure_status,
+                "reason": "Injected failure",
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps({"errors": [{"message": "Injected failure"}]}),
+            }
+        else:
+            record = self._read_record(key, request)
+
+        return self._build_response(record, request)
+
+    def _read_record(self, key: str, request: requests.PreparedRequest) -> dict:
+        """Load the recorded response for ``key``."""
+        path = _cassette_path(self.cassette_dir, key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise ReplayMissError(f"No recording for {key}", request=request)
+
+    @staticmethod
+    def _build_response(record: dict, request: requests.PreparedRequest) -> requests.Response:
+        """Turn a stored record into a ``requests.Response``."""
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.reason = record.get("reason")
+        response.headers = CaseInsensitiveDict(record["headers"])
+        response._content = record["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+def install_transport(canvas, settings: Settings):
+    """Mount the record or replay adapter selected by ``settings`` on a Canvas client."""
+    if settings.transport == "live":
+        return
+
+    if settings.transport == "record":
+        adapter = RecordingAdapter(settings.cassette_dir, secret=settings.api_key)
+    else:
+        adapter = ReplayAdapter(
+            settings.cassette_dir,
+            latency=settings.replay_latency,
+            jitter=settings.replay_jitter,
+            failure_rate=settings.replay_failure_rate,
+            failure_status=settings.replay_failure_status,
+            seed=settings.replay_seed
+        )
+
+    # canvasapi does not expose its session, so reach into the requester
+    session = canvas._Canvas__requester._session
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    logger.info(f"Canvas transport: {settings.transport} ({settings.cassette_dir})")
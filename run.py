@@ -26,15 +26,15 @@ def main():
     except ImportError as e:
         print(f"Import Error: {e}")
         print("Make sure you have installed the required dependencies:")
-        print("  pip install urwid canvasapi python-dotenv")
-        print("\nAlso ensure your .env file is properly configured with:")
-        print("  API_URL=your_canvas_url")
-        print("  API_KEY=your_canvas_api_key") 
-        print("  COURSE_LIST=course_id1,course_id2,course_id3")
+        print("  pip install urwid canvasapi==3.6.0 python-dotenv 'tomli; python_version < \"3.11\"'")
+        print("\nAlso ensure canvasctl.toml (or your .env file / environment) sets:")
+        print("  api_url / API_URL=your_canvas_url")
+        print("  api_key / API_KEY=your_canvas_api_key")
+        print("  course_list / COURSE_LIST=course_id1,course_id2,course_id3")
         return 1
         
     except FileNotFoundError:
-        print("Error: Could not find .env file or canvas_calendar module.")
+        print("Error: Could not find canvasctl.toml / .env file or CanvasCTL module.")
         print("Make sure you're running this from the correct directory.")
         return 1
         
@@ -0,0 +1,196 @@
+"""Settings loading, validation, hot reload and the client's assignment cache."""
+
+import os
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from CanvasCTL import canvas_api
+from CanvasCTL.canvas_api import CanvasAPIClient
+from CanvasCTL.config import ENV_OVERRIDES, Config, Settings, load_settings
+from CanvasCTL.models import Assignment
+
+REQUIRED = 'api_url = "https://canvas.test"\napi_key = "key"\ncourse_list = ["1", "2"]\n'
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch, tmp_path):
+    for env_var in ENV_OVERRIDES.values():
+        monkeypatch.delenv(env_var, raising=False)
+    monkeypatch.delenv("CANVASCTL_CONFIG", raising=False)
+    # Keep load_dotenv from picking up a developer's .env
+    monkeypatch.chdir(tmp_path)
+
+def write_config(tmp_path, text):
+    path = tmp_path / "canvasctl.toml"
+    path.write_text(text)
+    return str(path)
+
+def test_defaults_and_course_list_parsing(tmp_path):
+    settings = load_settings(write_config(tmp_path, REQUIRED))
+    assert settings.course_list == ("1", "2")
+    assert settings.concurrency == 4
+    assert settings.page_size == 100
+
+def test_env_overrides_toml(tmp_path, monkeypatch):
+    path = write_config(tmp_path, REQUIRED + "concurrency = 2\n")
+    monkeypatch.setenv("CANVASCTL_CONCURRENCY", "8")
+    monkeypatch.setenv("COURSE_LIST", "3, 4,")
+    settings = load_settings(path)
+    assert settings.concurrency == 8
+    assert settings.course_list == ("3", "4")
+    assert settings.api_url == "https://canvas.test"
+
+def test_canvasctl_table(tmp_path):
+    settings = load_settings(write_config(tmp_path, "[canvasctl]\n" + REQUIRED + "page_size = 50\n"))
+    assert settings.page_size == 50
+
+@pytest.mark.parametrize("text, message", [
+    ("colour = 1\n", "Unknown settings"),
+    ("canvasctl = 5\n", "must be a table"),
+    ("concurrency = 2.7\n", "concurrency"),
+    ("concurrency = true\n", "concurrency"),
+    ("cache_ttl = true\n", "cache_ttl"),
+    ("concurrency = 0\n", "concurrency must be at least 1"),
+    ("page_size = 0\n", "page_size must be at least 1"),
+    ("cache_ttl = -1\n", "cache_ttl must not be negative"),
+    ("replay_failure_rate = 1.5\n", "replay_failure_rate"),
+    ("replay_failure_status = 200\n", "replay_failure_status"),
+    ('transport = "tape"\n', "transport must be one of"),
+    ("transport = 1\n", "transport"),
+    ('timezone = "Mars/Olympus"\n', "Unknown timezone"),
+    ('timezone = "America"\n', "Unknown timezone"),
+])
+def test_invalid_settings_raise_value_error(tmp_path, text, message):
+    path = write_config(tmp_path, REQUIRED + text)
+    with pytest.raises(ValueError, match=message):
+        load_settings(path)
+
+def test_string_settings_reject_arrays(tmp_path):
+    path = write_config(tmp_path, 'api_url = "https://canvas.test"\napi_key = ["x"]\ncourse_list = "1"\n')
+    with pytest.raises(ValueError, match="api_key"):
+        load_settings(path)
+
+def test_integral_float_accepted(tmp_path):
+    assert load_settings(write_config(tmp_path, REQUIRED + "concurrency = 3.0\n")).concurrency == 3
+
+def test_missing_required_settings(tmp_path):
+    with pytest.raises(ValueError, match="api_key"):
+        load_settings(write_config(tmp_path, 'api_url = "https://canvas.test"\ncourse_list = "1"\n'))
+
+def test_replay_does_not_require_api_key(tmp_path):
+    path = write_config(tmp_path, 'api_url = "https://canvas.test"\ncourse_list = "1"\ntransport = "replay"\n')
+    assert load_settings(path).api_key == ""
+
+def _touch(path, offset):
+    """Bump the mtime so the change is seen even within the filesystem's resolution."""
+    stamp = time.time() + offset
+    os.utime(path, (stamp, stamp))
+
+def test_reload_if_changed(tmp_path):
+    path = write_config(tmp_path, REQUIRED)
+    config = Config(path)
+    assert config.reload_if_changed() is False
+
+    write_config(tmp_path, REQUIRED + "concurrency = 2\n")
+    _touch(path, 10)
+    assert config.reload_if_changed() is True
+    assert config.settings.concurrency == 2
+
+    write_config(tmp_path, REQUIRED + "concurrency = 0\n")
+    _touch(path, 20)
+    assert config.reload_if_changed() is False
+    assert config.settings.concurrency == 2
+
+    write_config(tmp_path, "canvasctl = 5\n")
+    _touch(path, 30)
+    assert config.reload_if_changed() is False
+    assert config.settings.concurrency == 2
+
+NOV_5 = datetime(2026, 11, 5, 4, 30, tzinfo=timezone.utc)  # after US DST ends on Nov 1
+OCT_5 = datetime(2026, 10, 5, 4, 30, tzinfo=timezone.utc)
+
+def _settings(**kwargs):
+    return Settings(api_url="https://canvas.test", api_key="key", course_list=("1",), **kwargs)
+
+def test_localize_named_zone_across_dst():
+    settings = _settings(timezone="America/New_York")
+    assert settings.localize(OCT_5).isoformat() == "2026-10-05T00:30:00-04:00"
+    assert settings.localize(NOV_5).isoformat() == "2026-11-04T23:30:00-05:00"
+
+def test_localize_utc_and_unset():
+    assert _settings(timezone="UTC").localize(NOV_5) == NOV_5
+    assert _settings().localize(NOV_5) is NOV_5
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+def test_localize_local_applies_dst_per_date(monkeypatch):
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        settings = _settings(timezone="local")
+        assert settings.localize(OCT_5).strftime("%Y-%m-%d %H:%M %z") == "2026-10-05 00:30 -0400"
+        assert settings.localize(NOV_5).strftime("%Y-%m-%d %H:%M %z") == "2026-11-04 23:30 -0500"
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+class StaticConfig:
+    """Minimal stand-in for ``Config`` whose settings a test can swap."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def client(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(canvas_api, "time", clock)
+    client = CanvasAPIClient(StaticConfig(_settings(cache_ttl=60)))
+    client.calls = 0
+    client.complete = True
+
+    def fake_load(course_id, settings):
+        client.calls += 1
+        assignment = Assignment(name=course_id, course="Course", due_date=NOV_5, due_time="04:30")
+        return [assignment], client.complete
+
+    client._load_course_assignments = fake_load
+    client.clock = clock
+    return client
+
+def test_cache_hit_within_ttl_and_expiry(client):
+    first = client.load_assignments()
+    assert client.load_assignments() is first
+    assert client.calls == 1
+
+    client.clock.now += 61
+    assert client.load_assignments() is not first
+    assert client.calls == 2
+
+def test_force_bypasses_cache(client):
+    first = client.load_assignments()
+    assert client.load_assignments(force=True) is not first
+    assert client.calls == 2
+
+def test_partial_load_not_cached(client):
+    client.complete = False
+    client.load_assignments()
+    client.load_assignments()
+    assert client.calls == 2
+
+def test_cache_dropped_only_when_fetch_settings_change(client):
+    first = client.load_assignments()
+
+    client.config.settings = replace(client.config.settings, refresh_interval=30)
+    assert client.load_assignments() is first
+
+    client.config.settings = replace(client.config.settings, course_list=("1", "2"))
+    assert client.load_assignments() is not first
+    assert client.calls == 3
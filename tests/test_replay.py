@@ -0,0 +1,183 @@
+"""Record a stub Canvas server, then replay it offline."""
+
+import json
+import os
+import threading
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+from CanvasCTL import replay
+from CanvasCTL.canvas_api import CanvasAPIClient
+from CanvasCTL.config import Settings
+from CanvasCTL.replay import ReplayAdapter, _cassette_path, request_key
+
+TOKEN = "secret-token"
+COURSE_URL = "http://canvas.test/api/v1/courses/101"
+
+ASSIGNMENTS = [
+    {"id": 1, "name": "Essay", "due_at": "2026-11-02T15:00:00Z", "html_url": "https://canvas/1"},
+    {"id": 2, "name": "Quiz", "due_at": "2026-11-03T15:00:00Z", "html_url": "https://canvas/2"},
+    {"id": 3, "name": "Lab", "due_at": "2026-11-04T15:00:00Z", "html_url": "https://canvas/3"},
+]
+
+class StubCanvasHandler(BaseHTTPRequestHandler):
+    """Serves one course whose assignments are split across pages."""
+
+    # Paths of every request served, reset by the stub_server fixture
+    paths = []
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        headers = {}
+
+        if parts.path == "/api/v1/courses/101":
+            body = {"id": 101, "name": "Biology"}
+        elif parts.path == "/api/v1/courses/101/assignments":
+            per_page = int(query["per_page"][-1])
+            page = int(query.get("page", ["1"])[0])
+            body = ASSIGNMENTS[(page - 1) * per_page:page * per_page]
+            if page * per_page < len(ASSIGNMENTS):
+                host = self.headers["Host"]
+                headers["Link"] = (f'<http://{host}{parts.path}?page={page + 1}'
+                                   f'&per_page={per_page}&access_token={TOKEN}>; rel="next"')
+        else:
+            self.send_error(404)
+            return
+
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+class StaticConfig:
+    """Minimal stand-in for ``Config`` that never touches the environment."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+@pytest.fixture
+def stub_server():
+    StubCanvasHandler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubCanvasHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _names(collection):
+    return sorted(a.name for assignments in collection._assignments_by_date.values() for a in assignments)
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_record_then_replay_returns_same_assignments(stub_server, tmp_path, caplog):
+    cassettes = str(tmp_path / "cassettes")
+    settings = Settings(api_url=stub_server.url, api_key=TOKEN, course_list=("101",),
+                        page_size=2, transport="record", cassette_dir=cassettes)
+
+    recorded = CanvasAPIClient(StaticConfig(settings)).load_assignments()
+    assert _names(recorded) == ["Essay", "Lab", "Quiz"]
+
+    recordings = []
+    for name in os.listdir(cassettes):
+        with open(os.path.join(cassettes, name), encoding="utf-8") as f:
+            recordings.append(f.read())
+    assert not any(TOKEN in recording for recording in recordings)
+    assert any("access_token=SCRUBBED>; rel" in recording for recording in recordings)
+
+    replay_settings = Settings(api_url=stub_server.url, api_key="", course_list=("101",),
+                               page_size=2, transport="replay", cassette_dir=cassettes)
+
+    # A request that was never recorded misses instead of falling through to the server
+    served = len(StubCanvasHandler.paths)
+    unrecorded = CanvasAPIClient(StaticConfig(replace(replay_settings, page_size=3))).load_assignments()
+    assert _names(unrecorded) == []
+    assert "No recording for GET" in caplog.text
+    assert len(StubCanvasHandler.paths) == served
+
+    stub_server.shutdown()
+    stub_server.server_close()
+    replayed = CanvasAPIClient(StaticConfig(replay_settings)).load_assignments()
+    assert _names(replayed) == _names(recorded)
+    assert len(StubCanvasHandler.paths) == served
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_page_size_sent_once_on_first_request(stub_server):
+    settings = Settings(api_url=stub_server.url, api_key=TOKEN, course_list=("101",), page_size=2)
+    CanvasAPIClient(StaticConfig(settings)).load_assignments()
+
+    queries = [parse_qs(urlsplit(path).query) for path in StubCanvasHandler.paths
+               if urlsplit(path).path == "/api/v1/courses/101/assignments"]
+    first_page = [query for query in queries if "page" not in query]
+    assert len(first_page) == 1
+    assert first_page[0]["per_page"] == ["2"]
+
+def _record_course(tmp_path):
+    """Write a cassette for a single GET of ``COURSE_URL``."""
+    cassettes = str(tmp_path)
+    request = requests.Request("GET", COURSE_URL).prepare()
+    with open(_cassette_path(cassettes, request_key(request)), "w", encoding="utf-8") as f:
+        json.dump({"status": 200, "headers": {}, "body": "{}"}, f)
+    return cassettes
+
+def _failure_pattern(cassettes, failure_status):
+    session = requests.Session()
+    session.mount("http://", ReplayAdapter(cassettes, failure_rate=0.5,
+                                           failure_status=failure_status, seed=7))
+    pattern = []
+    for _ in range(20):
+        try:
+            response = session.get(COURSE_URL)
+            pattern.append(response.status_code)
+        except requests.exceptions.ConnectionError:
+            pattern.append("error")
+    return pattern
+
+@pytest.mark.parametrize("failure_status", [0, 503])
+def test_replay_failures_repeat_with_same_seed(tmp_path, failure_status):
+    cassettes = _record_course(tmp_path)
+
+    first = _failure_pattern(cassettes, failure_status)
+    assert first == _failure_pattern(cassettes, failure_status)
+
+    injected = failure_status or "error"
+    assert injected in first and 200 in first
+
+class RecordingSleep:
+    """Stands in for ``time`` in the replay module and records sleep durations."""
+
+    def __init__(self):
+        self.durations = []
+
+    def sleep(self, seconds):
+        self.durations.append(seconds)
+
+def _sleep_schedule(cassettes, monkeypatch):
+    clock = RecordingSleep()
+    monkeypatch.setattr(replay, "time", clock)
+    session = requests.Session()
+    session.mount("http://", ReplayAdapter(cassettes, latency=0.2, jitter=0.1, seed=7))
+    for _ in range(10):
+        session.get(COURSE_URL)
+    return clock.durations
+
+def test_replay_latency_repeats_with_same_seed(tmp_path, monkeypatch):
+    cassettes = _record_course(tmp_path)
+
+    first = _sleep_schedule(cassettes, monkeypatch)
+    assert first == _sleep_schedule(cassettes, monkeypatch)
+    assert len(first) == 10 and len(set(first)) > 1
+    assert all(0.2 <= duration <= 0.3 for duration in first)